@@ -0,0 +1,89 @@
+"""
+Generated by generate_validator.py from advgpt_format.SCHEMA - do not edit.
+"""
+
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'type': 'object', 'required': ['meta', 'start_location', 'locations', 'inventory_items', 'game_flags', 'player'], 'properties': {'meta': {'type': 'object', 'required': ['title', 'author', 'version']}, 'start_location': {'type': 'string'}, 'locations': {'type': 'object', 'propertyNames': {'type': 'string'}, 'additionalProperties': {'type': 'object', 'required': ['title', 'description', 'exits'], 'properties': {'exits': {'type': 'object', 'additionalProperties': {'type': 'string'}}}}}, 'player': {'type': 'object', 'required': ['inventory', 'current_location', 'flags']}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['meta', 'start_location', 'locations', 'inventory_items', 'game_flags', 'player']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'type': 'object', 'required': ['meta', 'start_location', 'locations', 'inventory_items', 'game_flags', 'player'], 'properties': {'meta': {'type': 'object', 'required': ['title', 'author', 'version']}, 'start_location': {'type': 'string'}, 'locations': {'type': 'object', 'propertyNames': {'type': 'string'}, 'additionalProperties': {'type': 'object', 'required': ['title', 'description', 'exits'], 'properties': {'exits': {'type': 'object', 'additionalProperties': {'type': 'string'}}}}}, 'player': {'type': 'object', 'required': ['inventory', 'current_location', 'flags']}}}, rule='required')
+        data_keys = set(data.keys())
+        if "meta" in data_keys:
+            data_keys.remove("meta")
+            data__meta = data["meta"]
+            if not isinstance(data__meta, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".meta must be object", value=data__meta, name="" + (name_prefix or "data") + ".meta", definition={'type': 'object', 'required': ['title', 'author', 'version']}, rule='type')
+            data__meta_is_dict = isinstance(data__meta, dict)
+            if data__meta_is_dict:
+                data__meta__missing_keys = set(['title', 'author', 'version']) - data__meta.keys()
+                if data__meta__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".meta must contain " + (str(sorted(data__meta__missing_keys)) + " properties"), value=data__meta, name="" + (name_prefix or "data") + ".meta", definition={'type': 'object', 'required': ['title', 'author', 'version']}, rule='required')
+        if "start_location" in data_keys:
+            data_keys.remove("start_location")
+            data__startlocation = data["start_location"]
+            if not isinstance(data__startlocation, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".start_location must be string", value=data__startlocation, name="" + (name_prefix or "data") + ".start_location", definition={'type': 'string'}, rule='type')
+        if "locations" in data_keys:
+            data_keys.remove("locations")
+            data__locations = data["locations"]
+            if not isinstance(data__locations, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".locations must be object", value=data__locations, name="" + (name_prefix or "data") + ".locations", definition={'type': 'object', 'propertyNames': {'type': 'string'}, 'additionalProperties': {'type': 'object', 'required': ['title', 'description', 'exits'], 'properties': {'exits': {'type': 'object', 'additionalProperties': {'type': 'string'}}}}}, rule='type')
+            data__locations_is_dict = isinstance(data__locations, dict)
+            if data__locations_is_dict:
+                data__locations_keys = set(data__locations.keys())
+                for data__locations_key in data__locations_keys:
+                    if data__locations_key not in []:
+                        data__locations_value = data__locations.get(data__locations_key)
+                        if not isinstance(data__locations_value, (dict)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".locations.{data__locations_key}".format(**locals()) + " must be object", value=data__locations_value, name="" + (name_prefix or "data") + ".locations.{data__locations_key}".format(**locals()) + "", definition={'type': 'object', 'required': ['title', 'description', 'exits'], 'properties': {'exits': {'type': 'object', 'additionalProperties': {'type': 'string'}}}}, rule='type')
+                        data__locations_value_is_dict = isinstance(data__locations_value, dict)
+                        if data__locations_value_is_dict:
+                            data__locations_value__missing_keys = set(['title', 'description', 'exits']) - data__locations_value.keys()
+                            if data__locations_value__missing_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".locations.{data__locations_key}".format(**locals()) + " must contain " + (str(sorted(data__locations_value__missing_keys)) + " properties"), value=data__locations_value, name="" + (name_prefix or "data") + ".locations.{data__locations_key}".format(**locals()) + "", definition={'type': 'object', 'required': ['title', 'description', 'exits'], 'properties': {'exits': {'type': 'object', 'additionalProperties': {'type': 'string'}}}}, rule='required')
+                            data__locations_value_keys = set(data__locations_value.keys())
+                            if "exits" in data__locations_value_keys:
+                                data__locations_value_keys.remove("exits")
+                                data__locations_value__exits = data__locations_value["exits"]
+                                if not isinstance(data__locations_value__exits, (dict)):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".locations.{data__locations_key}.exits".format(**locals()) + " must be object", value=data__locations_value__exits, name="" + (name_prefix or "data") + ".locations.{data__locations_key}.exits".format(**locals()) + "", definition={'type': 'object', 'additionalProperties': {'type': 'string'}}, rule='type')
+                                data__locations_value__exits_is_dict = isinstance(data__locations_value__exits, dict)
+                                if data__locations_value__exits_is_dict:
+                                    data__locations_value__exits_keys = set(data__locations_value__exits.keys())
+                                    for data__locations_value__exits_key in data__locations_value__exits_keys:
+                                        if data__locations_value__exits_key not in []:
+                                            data__locations_value__exits_value = data__locations_value__exits.get(data__locations_value__exits_key)
+                                            if not isinstance(data__locations_value__exits_value, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".locations.{data__locations_key}.exits.{data__locations_value__exits_key}".format(**locals()) + " must be string", value=data__locations_value__exits_value, name="" + (name_prefix or "data") + ".locations.{data__locations_key}.exits.{data__locations_value__exits_key}".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                data__locations_len = len(data__locations)
+                if data__locations_len != 0:
+                    data__locations_property_names = True
+                    for data__locations_key in data__locations:
+                        try:
+                            if not isinstance(data__locations_key, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".locations must be string", value=data__locations_key, name="" + (name_prefix or "data") + ".locations", definition={'type': 'string'}, rule='type')
+                        except (JsonSchemaValueException, JsonSchemaValuesException):
+                            data__locations_property_names = False
+                    if not data__locations_property_names:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".locations must be named by propertyName definition", value=data__locations, name="" + (name_prefix or "data") + ".locations", definition={'type': 'object', 'propertyNames': {'type': 'string'}, 'additionalProperties': {'type': 'object', 'required': ['title', 'description', 'exits'], 'properties': {'exits': {'type': 'object', 'additionalProperties': {'type': 'string'}}}}}, rule='propertyNames')
+        if "player" in data_keys:
+            data_keys.remove("player")
+            data__player = data["player"]
+            if not isinstance(data__player, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".player must be object", value=data__player, name="" + (name_prefix or "data") + ".player", definition={'type': 'object', 'required': ['inventory', 'current_location', 'flags']}, rule='type')
+            data__player_is_dict = isinstance(data__player, dict)
+            if data__player_is_dict:
+                data__player__missing_keys = set(['inventory', 'current_location', 'flags']) - data__player.keys()
+                if data__player__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".player must contain " + (str(sorted(data__player__missing_keys)) + " properties"), value=data__player, name="" + (name_prefix or "data") + ".player", definition={'type': 'object', 'required': ['inventory', 'current_location', 'flags']}, rule='required')
+    return data
\ No newline at end of file
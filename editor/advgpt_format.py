@@ -5,10 +5,287 @@ This module defines the .advgpt format used for storing and exchanging
 adventure game data between the Python editor and C engine.
 """
 
+from __future__ import annotations
+
+import contextlib
 import json
-from typing import Dict, List, Any, Optional
+import logging
+import os
+import sys
 from pathlib import Path
 
+from fastjsonschema import JsonSchemaValueException
+
+# typing is only needed by type checkers; avoid importing it at runtime
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict, List, Any, Optional, KeysView, Tuple
+
+logger = logging.getLogger(__name__)
+
+# orjson is optional; it serializes and parses several times faster than the
+# stdlib json module, which is used as the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ujson is an optional, slower alternative used for parsing when orjson is
+# not installed
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# msgpack is optional and only needed for save_to_file_binary
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+# Keys every game, meta section, location and player section must contain
+REQUIRED_KEYS = ("meta", "start_location", "locations", "inventory_items", "game_flags", "player")
+META_REQUIRED_KEYS = ("title", "author", "version")
+LOCATION_REQUIRED_KEYS = ("title", "description", "exits")
+PLAYER_REQUIRED_KEYS = ("inventory", "current_location", "flags")
+
+# JSON Schema for the structural part of the format. Cross-references between
+# locations (exits, start and player location) are checked separately in
+# AdvGPTFormat.validate_game_data since they cannot be expressed in the schema.
+SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "required": list(REQUIRED_KEYS),
+    "properties": {
+        "meta": {
+            "type": "object",
+            "required": list(META_REQUIRED_KEYS)
+        },
+        "start_location": {"type": "string"},
+        "locations": {
+            "type": "object",
+            "propertyNames": {"type": "string"},
+            "additionalProperties": {
+                "type": "object",
+                "required": list(LOCATION_REQUIRED_KEYS),
+                "properties": {
+                    "exits": {
+                        "type": "object",
+                        "additionalProperties": {"type": "string"}
+                    }
+                }
+            }
+        },
+        "player": {
+            "type": "object",
+            "required": list(PLAYER_REQUIRED_KEYS)
+        }
+    }
+}
+
+# The validator is generated from SCHEMA by generate_validator.py and checked
+# in, so importing this module does not pay the schema compile cost. Fall back
+# to compiling at import time if the generated module is unavailable. Either
+# way it is built once per process and shared by every validate_game_data call.
+try:
+    from _advgpt_validator import validate as _VALIDATE
+except ImportError:
+    import fastjsonschema
+    _VALIDATE = fastjsonschema.compile(SCHEMA)
+
+_REQUIRED_KEY_SET = frozenset(REQUIRED_KEYS)
+_META_REQUIRED_KEY_SET = frozenset(META_REQUIRED_KEYS)
+_LOCATION_REQUIRED_KEY_SET = frozenset(LOCATION_REQUIRED_KEYS)
+_PLAYER_REQUIRED_KEY_SET = frozenset(PLAYER_REQUIRED_KEYS)
+
+
+def _is_valid_game(game_data: Any) -> bool:
+    """
+    Check SCHEMA and the cross-references in one pass written against the
+    fixed .advgpt shape. This only answers whether the data is valid;
+    validate_game_data falls back to the full checks to describe errors.
+    """
+    if not isinstance(game_data, dict) or not _REQUIRED_KEY_SET <= game_data.keys():
+        return False
+    meta = game_data["meta"]
+    if not isinstance(meta, dict) or not _META_REQUIRED_KEY_SET <= meta.keys():
+        return False
+    player = game_data["player"]
+    if not isinstance(player, dict) or not _PLAYER_REQUIRED_KEY_SET <= player.keys():
+        return False
+    start_location = game_data["start_location"]
+    locations = game_data["locations"]
+    if not isinstance(start_location, str) or not isinstance(locations, dict):
+        return False
+    
+    loc_keys = locations.keys()
+    try:
+        if start_location not in loc_keys or player["current_location"] not in loc_keys:
+            return False
+        # Location IDs must be strings, so exit targets that are all IDs are too
+        for loc_id, location in locations.items():
+            if not isinstance(loc_id, str):
+                return False
+            if not isinstance(location, dict) or not _LOCATION_REQUIRED_KEY_SET <= location.keys():
+                return False
+            exits = location["exits"]
+            if not isinstance(exits, dict) or not loc_keys >= set(exits.values()):
+                return False
+    except TypeError:
+        # Unhashable IDs
+        return False
+    return True
+
+
+# Cross-reference error messages, as bound str.format methods built once
+_ERR_BAD_START = "Start location '{}' not found in locations".format
+_ERR_BAD_EXIT = "Location '{}' exit '{}' points to non-existent location '{}'".format
+_ERR_BAD_PLAYER_LOCATION = "Player current_location '{}' not found in locations".format
+
+# Output buffer size for save_to_file
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Files that passed validation in load_from_file, keyed on path, size, inode
+# and mtime. save_to_file replaces files rather than rewriting them, so a new
+# save always changes the inode even if the mtime does not. Only the keys are
+# kept, oldest first, and at most _VALIDATED_FILES_MAX of them.
+_validated_files: Dict[Tuple[str, int, int, int], None] = {}
+_VALIDATED_FILES_MAX = 32
+
+
+@contextlib.contextmanager
+def atomic_open(file_path: str, buffering: int = -1):
+    """
+    Open a temporary file next to file_path for binary writing and move it
+    over file_path once the block completes, so a failed save never leaves
+    a truncated file behind.
+    """
+    path = Path(file_path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with tmp_path.open('wb', buffering=buffering) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj as indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON with the fastest available parser."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if ujson is not None:
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+def _write_member(f, key: str, value: Any, indent: bytes) -> None:
+    """Write one '"key": value' object member, nested at the given indent."""
+    # Non-string keys are written as strings, as json.dump does
+    if not isinstance(key, str):
+        key = dumps(key).decode()
+    f.write(indent + dumps(key) + b": " + dumps(value).replace(b"\n", b"\n" + indent))
+
+
+def _write_game_data(f, game_data: Dict[str, Any]) -> None:
+    """
+    Write game data to a binary file in the same layout as
+    json.dump(indent=2). Locations are serialized one at a time so memory
+    use is bounded by the largest location rather than the whole game.
+    """
+    f.write(b"{")
+    for i, (key, value) in enumerate(game_data.items()):
+        f.write(b",\n" if i else b"\n")
+        if key == "locations" and isinstance(value, dict) and value:
+            f.write(b'  "locations": {')
+            for j, (loc_id, location) in enumerate(value.items()):
+                f.write(b",\n" if j else b"\n")
+                _write_member(f, loc_id, location, b"    ")
+            f.write(b"\n  }")
+        else:
+            _write_member(f, key, value, b"  ")
+    f.write(b"\n}" if game_data else b"}")
+
+
+def _intern_references(game_data: Dict[str, Any]) -> None:
+    """
+    Intern exit directions and the location/item IDs that locations refer
+    to, so the many repeated copies parsed from a file share one string.
+    """
+    intern = sys.intern
+    for location in game_data["locations"].values():
+        location["exits"] = {intern(d): intern(t) for d, t in location["exits"].items()}
+        items = location.get("items")
+        if isinstance(items, list):
+            location["items"] = [intern(i) if isinstance(i, str) else i for i in items]
+
+
+def _to_id_handles(game_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return a copy of game data in which every location and item reference
+    is an integer index into an "_id_table" of IDs. Locations and defined
+    items become lists in table order; item IDs that are referenced but not
+    defined are appended to the item table after the defined ones.
+    """
+    location_ids = list(game_data["locations"])
+    item_ids = list(game_data["inventory_items"])
+    location_index = {loc_id: i for i, loc_id in enumerate(location_ids)}
+    item_index = {item_id: i for i, item_id in enumerate(item_ids)}
+
+    def item_handle(item_id: str) -> int:
+        if item_id not in item_index:
+            item_index[item_id] = len(item_ids)
+            item_ids.append(item_id)
+        return item_index[item_id]
+
+    locations = []
+    for location in game_data["locations"].values():
+        location = dict(location)
+        location["exits"] = {d: location_index[t] for d, t in location["exits"].items()}
+        location["items"] = [item_handle(i) for i in location.get("items", [])]
+        locations.append(location)
+
+    player = dict(game_data["player"])
+    player["current_location"] = location_index[player["current_location"]]
+    player["inventory"] = [item_handle(i) for i in player["inventory"]]
+
+    data = dict(game_data)
+    data["start_location"] = location_index[game_data["start_location"]]
+    data["locations"] = locations
+    data["inventory_items"] = list(game_data["inventory_items"].values())
+    data["player"] = player
+    data["_id_table"] = {"locations": location_ids, "items": item_ids}
+    return data
+
+
+def _from_id_handles(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Reverse _to_id_handles, turning integer handles back into IDs."""
+    id_table = data.pop("_id_table")
+    location_ids = id_table["locations"]
+    item_ids = id_table["items"]
+
+    for location in data["locations"]:
+        location["exits"] = {d: location_ids[t] for d, t in location["exits"].items()}
+        location["items"] = [item_ids[i] for i in location["items"]]
+
+    player = data["player"]
+    player["current_location"] = location_ids[player["current_location"]]
+    player["inventory"] = [item_ids[i] for i in player["inventory"]]
+
+    data["start_location"] = location_ids[data["start_location"]]
+    data["locations"] = dict(zip(location_ids, data["locations"]))
+    data["inventory_items"] = dict(zip(item_ids, data["inventory_items"]))
+    return data
+
 
 class AdvGPTFormat:
     """
@@ -99,105 +376,170 @@ class AdvGPTFormat:
         }
     
     @staticmethod
-    def validate_game_data(game_data: Dict[str, Any]) -> List[str]:
+    def validate_game_data(game_data: Dict[str, Any], fast: bool = False) -> List[str]:
         """
         Validate game data structure and return list of errors.
-        Returns empty list if valid.
+        Returns empty list if valid. Structure is checked against SCHEMA,
+        which stops at the first problem and describes it in fastjsonschema's
+        wording, e.g. "data must contain ['meta'] properties". Only data
+        with a valid structure has its location references checked, and
+        every broken reference is reported unless fast is True, in which
+        case validation stops at the first error.
         """
-        errors = []
-        
-        # Check required top-level keys
-        required_keys = ["meta", "start_location", "locations", "inventory_items", "game_flags", "player"]
-        for key in required_keys:
-            if key not in game_data:
-                errors.append(f"Missing required key: {key}")
+        # Valid data, the common case, only needs the specialized check
+        if _is_valid_game(game_data):
+            return []
         
-        if errors:
-            return errors
+        # Check structure against the schema; this stops at the first error
+        try:
+            _VALIDATE(game_data)
+        except JsonSchemaValueException as e:
+            return [e.message]
         
-        # Check meta section
-        meta = game_data["meta"]
-        meta_required = ["title", "author", "version"]
-        for key in meta_required:
-            if key not in meta:
-                errors.append(f"Missing meta key: {key}")
+        errors = []
         
         # Check start location exists
         start_location = game_data["start_location"]
-        locations = game_data["locations"]
+        loc_keys = game_data["locations"].keys()
         
-        if start_location not in locations:
-            errors.append(f"Start location '{start_location}' not found in locations")
+        if start_location not in loc_keys:
+            errors.append(_ERR_BAD_START(start_location))
+            if fast:
+                return errors
         
         # Validate each location
-        for loc_id, location in locations.items():
-            location_errors = AdvGPTFormat._validate_location(loc_id, location, locations)
-            errors.extend(location_errors)
+        validate_location = AdvGPTFormat._validate_location
+        loc_items = game_data["locations"].items()
+        for loc_id, location in loc_items:
+            location_errors = validate_location(loc_id, location, loc_keys)
+            if location_errors:
+                if fast:
+                    return location_errors[:1]
+                errors.extend(location_errors)
         
-        # Check player data
+        # Check player location exists
         player = game_data["player"]
-        player_required = ["inventory", "current_location", "flags"]
-        for key in player_required:
-            if key not in player:
-                errors.append(f"Missing player key: {key}")
-        
-        if "current_location" in player and player["current_location"] not in locations:
-            errors.append(f"Player current_location '{player['current_location']}' not found in locations")
+        if player["current_location"] not in loc_keys:
+            errors.append(_ERR_BAD_PLAYER_LOCATION(player["current_location"]))
         
         return errors
     
     @staticmethod
-    def _validate_location(loc_id: str, location: Dict[str, Any], all_locations: Dict[str, Any]) -> List[str]:
-        """Validate a single location."""
+    def _validate_location(loc_id: str, location: Dict[str, Any], loc_keys: KeysView[str]) -> List[str]:
+        """Validate the exits of a single location."""
         errors = []
         
-        # Check required location keys
-        required_keys = ["title", "description", "exits"]
-        for key in required_keys:
-            if key not in location:
-                errors.append(f"Location '{loc_id}' missing required key: {key}")
+        # Check that all exits point to valid locations, with one set
+        # operation so valid locations never enter the Python loop. The
+        # comparison iterates the exits, not the (much larger) keys view.
+        exits = location["exits"]
+        if loc_keys >= set(exits.values()):
+            return errors
         
-        # Check that all exits point to valid locations
-        if "exits" in location:
-            for direction, target_location in location["exits"].items():
-                if target_location not in all_locations:
-                    errors.append(f"Location '{loc_id}' exit '{direction}' points to non-existent location '{target_location}'")
+        for direction, target_location in exits.items():
+            if target_location not in loc_keys:
+                errors.append(_ERR_BAD_EXIT(loc_id, direction, target_location))
         
         return errors
     
+    @staticmethod
+    def _validate_for_save(game_data: Dict[str, Any]) -> bool:
+        """Validate game data before saving, logging the first error found."""
+        errors = AdvGPTFormat.validate_game_data(game_data, fast=True)
+        if errors:
+            logger.warning("Validation errors: %s", errors)
+            return False
+        return True
+    
     @staticmethod
     def save_to_file(game_data: Dict[str, Any], file_path: str) -> bool:
         """Save game data to .advgpt file. Returns True on success."""
         try:
-            # Validate before saving
-            errors = AdvGPTFormat.validate_game_data(game_data)
-            if errors:
-                print(f"Validation errors: {errors}")
+            if not AdvGPTFormat._validate_for_save(game_data):
                 return False
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(game_data, f, indent=2, ensure_ascii=False)
+            # The large buffer batches the streamed writes into few syscalls
+            with atomic_open(file_path, buffering=_WRITE_BUFFER_SIZE) as f:
+                _write_game_data(f, game_data)
             return True
         except Exception as e:
-            print(f"Error saving game data: {e}")
+            logger.error("Error saving game data: %s", e, exc_info=True)
             return False
     
     @staticmethod
-    def load_from_file(file_path: str) -> Optional[Dict[str, Any]]:
-        """Load game data from .advgpt file. Returns None on error."""
+    def save_to_file_binary(game_data: Dict[str, Any], file_path: str) -> bool:
+        """
+        Save game data as MessagePack, a compact binary encoding that is much
+        cheaper for the engine to parse than indented JSON. Location and item
+        references are stored as integer indexes into an "_id_table" field,
+        so the engine compares integers rather than strings. Requires the
+        msgpack package. Returns True on success.
+        """
+        if msgpack is None:
+            logger.error("Error saving game data: msgpack is not installed")
+            return False
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                game_data = json.load(f)
+            if not AdvGPTFormat._validate_for_save(game_data):
+                return False
             
-            # Validate loaded data
-            errors = AdvGPTFormat.validate_game_data(game_data)
+            data = _to_id_handles(game_data)
+            with atomic_open(file_path) as f:
+                f.write(msgpack.packb(data, use_bin_type=True))
+            return True
+        except Exception as e:
+            logger.error("Error saving game data: %s", e, exc_info=True)
+            return False
+    
+    @staticmethod
+    def load_from_file_binary(file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Load game data saved by save_to_file_binary, with references turned
+        back into IDs. Returns None on error.
+        """
+        if msgpack is None:
+            logger.error("Error loading game data: msgpack is not installed")
+            return None
+        try:
+            game_data = _from_id_handles(msgpack.unpackb(Path(file_path).read_bytes()))
+            
+            errors = AdvGPTFormat.validate_game_data(game_data, fast=True)
             if errors:
-                print(f"Loaded game data has validation errors: {errors}")
+                logger.warning("Loaded game data has validation errors: %s", errors)
                 return None
             
             return game_data
         except Exception as e:
-            print(f"Error loading game data: {e}")
+            logger.error("Error loading game data: %s", e, exc_info=True)
+            return None
+    
+    @staticmethod
+    def load_from_file(file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Load game data from .advgpt file. Returns None on error. Files that
+        passed validation are remembered by path, size, inode and
+        modification time, so reloading an unchanged file skips validation.
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                data = f.read()
+            game_data = loads(data)
+            
+            # Validate loaded data, unless this version of the file already passed
+            file_key = (file_path, st.st_size, st.st_ino, st.st_mtime_ns)
+            if file_key not in _validated_files:
+                errors = AdvGPTFormat.validate_game_data(game_data, fast=True)
+                if errors:
+                    logger.warning("Loaded game data has validation errors: %s", errors)
+                    return None
+                _validated_files[file_key] = None
+                if len(_validated_files) > _VALIDATED_FILES_MAX:
+                    del _validated_files[next(iter(_validated_files))]
+            
+            _intern_references(game_data)
+            return game_data
+        except Exception as e:
+            logger.error("Error loading game data: %s", e, exc_info=True)
             return None
     
     @staticmethod
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Regenerate _advgpt_validator.py from advgpt_format.SCHEMA.
+
+Run this after changing the schema:
+
+    cd editor
+    python3 generate_validator.py
+"""
+
+from pathlib import Path
+
+import fastjsonschema
+
+from advgpt_format import SCHEMA
+
+
+HEADER = '''"""
+Generated by generate_validator.py from advgpt_format.SCHEMA - do not edit.
+"""
+
+'''
+
+
+def main():
+    """Write the generated validator next to this script."""
+    code = fastjsonschema.compile_to_code(SCHEMA)
+    output_path = Path(__file__).with_name("_advgpt_validator.py")
+    output_path.write_text(HEADER + code, encoding="utf-8")
+    print(f"Wrote {output_path}")
+
+
+if __name__ == "__main__":
+    main()
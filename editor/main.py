@@ -5,24 +5,389 @@ A cross-platform editor for creating text adventure games with static images.
 """
 
 import sys
-import json
 import os
+import hashlib
+import functools
+from dataclasses import dataclass
 from pathlib import Path
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QTabWidget, QVBoxLayout, QHBoxLayout,
-    QWidget, QLabel, QLineEdit, QTextEdit, QPushButton, QFileDialog,
-    QMessageBox, QSplitter, QListWidget, QListWidgetItem, QFormLayout,
-    QGroupBox, QScrollArea, QFrame
+    QWidget, QLabel, QLineEdit, QPlainTextEdit, QPushButton, QFileDialog,
+    QMessageBox, QSplitter, QListView, QAbstractItemView, QFormLayout,
+    QGroupBox, QScrollArea, QFrame, QStatusBar
 )
-from PySide6.QtCore import Qt, QSettings
-from PySide6.QtGui import QPixmap, QIcon, QAction
+from PySide6.QtCore import (
+    Qt, QSettings, QAbstractListModel, QModelIndex, QStringListModel,
+    QObject, QRunnable, QThreadPool, Signal, QSize, QStandardPaths, QSignalBlocker,
+    QTimer
+)
+from PySide6.QtGui import QPixmap, QImageReader, QIcon, QAction, QPainter, QColor, QKeySequence
+
+from advgpt_format import AdvGPTFormat, atomic_open, dumps, loads
+
+# File dialog filters
+IMAGE_FILE_FILTER = "Image Files (*.png *.jpg *.jpeg *.bmp *.gif)"
+PROJECT_FILE_FILTER = "AdventureGPT Projects (*.advgpt);;JSON Files (*.json)"
+
+@dataclass
+class ProjectMeta:
+    """The project metadata shown in the story editor."""
+    __slots__ = ("title", "author", "description")
+    title: str
+    author: str
+    description: str
+    
+    @classmethod
+    def from_dict(cls, meta):
+        """Create a ProjectMeta from a project's "meta" section."""
+        return cls(meta.get("title", ""), meta.get("author", ""), meta.get("description", ""))
+
+
+def read_project_file(file_path):
+    """Read and parse a project file."""
+    return loads(Path(file_path).read_bytes())
+
+
+def write_project_file(file_path, data):
+    """
+    Write serialized project data to a file. The data is written to a
+    temporary file that then replaces file_path, so a failed save never
+    leaves a truncated project behind.
+    """
+    with atomic_open(file_path) as f:
+        f.write(data)
+
+
+def read_scaled_image(file_path, max_size):
+    """
+    Decode an image no larger than max_size, keeping its aspect ratio.
+    The codec scales while decoding, so a large image is never decoded at
+    full resolution. Images smaller than max_size are not enlarged.
+    """
+    reader = QImageReader(file_path)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if size.isValid() and (size.width() > max_size.width() or size.height() > max_size.height()):
+        reader.setScaledSize(size.scaled(max_size, Qt.KeepAspectRatio))
+    return reader.read()
+
+
+def write_thumbnail(file_path, max_size, cache_path, mtime_ns):
+    """
+    Decode a thumbnail of an image, store it as a PNG and return it. The
+    PNG gets the image's modification time and is written to a temporary
+    file first, so a reader never sees a partly written thumbnail.
+    """
+    image = read_scaled_image(file_path, max_size)
+    if image.isNull():
+        raise OSError(f"Cannot read image {file_path}")
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    if not image.save(str(tmp_path), "PNG"):
+        tmp_path.unlink(missing_ok=True)
+        raise OSError(f"Cannot write thumbnail {cache_path}")
+    os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+    os.replace(tmp_path, cache_path)
+    return image
+
+
+class IoSignals(QObject):
+    """Signals reporting the outcome of a IoTask."""
+    finished = Signal(str, object)
+    failed = Signal(str, str)
+
+
+class IoTask(QRunnable):
+    """
+    Runs a file operation on a thread pool thread. Emits finished
+    with the file path and the operation's result, or failed with the file
+    path and an error message. Connect the signals to methods of a widget
+    so the slots run on the GUI thread.
+    """
+    
+    def __init__(self, func, file_path, *args):
+        super().__init__()
+        self.signals = IoSignals()
+        self._func = func
+        self._file_path = file_path
+        self._args = args
+        
+    def run(self):
+        try:
+            result = self._func(self._file_path, *self._args)
+        except Exception as e:
+            self.signals.failed.emit(self._file_path, str(e))
+        else:
+            self.signals.finished.emit(self._file_path, result)
+
+
+class LocationsModel(QAbstractListModel):
+    """
+    List model holding the project's locations as (location ID, location
+    data) pairs. It is the single source of truth for location data; views
+    only create delegates for the rows they show.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._locations = []
+        self.next_location_number = 1
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._locations)
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._locations[index.row()][0]
+        return None
+        
+    def bulk_load(self, locations):
+        """Replace all locations with (location ID, location data) pairs."""
+        locations = list(locations)
+        next_location_number = next_number((loc_id for loc_id, _ in locations), "location_")
+        self.beginResetModel()
+        self._locations = locations
+        self.endResetModel()
+        self.next_location_number = next_location_number
+        
+    def new_location_id(self):
+        """Return a location ID that has not been handed out before."""
+        location_id = "location_%d" % self.next_location_number
+        self.next_location_number += 1
+        return location_id
+        
+    def add_locations(self, locations):
+        """Append (location ID, location data) pairs with a single insert."""
+        locations = list(locations)
+        if not locations:
+            return
+        first = len(self._locations)
+        self.beginInsertRows(QModelIndex(), first, first + len(locations) - 1)
+        self._locations.extend(locations)
+        self.endInsertRows()
+        
+    def add_location(self, location_id, location):
+        """Append a location and return its row."""
+        self.add_locations([(location_id, location)])
+        return len(self._locations) - 1
+        
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or row < 0 or row + count > len(self._locations):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._locations[row:row + count]
+        self.endRemoveRows()
+        return True
+        
+    def location(self, row):
+        """Return the (location ID, location data) pair at the given row."""
+        return self._locations[row]
+        
+    def locations(self):
+        """Return all locations as a dict keyed by location ID."""
+        return dict(self._locations)
+
+
+@functools.lru_cache(maxsize=64)
+def icon(name):
+    """
+    Return the theme icon with the given name. Icons are cached, so every
+    button using an icon shares one QIcon instead of loading it again.
+    """
+    return QIcon.fromTheme(name)
+
+
+def set_standard_shortcut(action, key, fallback):
+    """
+    Give an action the platform's shortcuts for a standard key, or the
+    fallback shortcut where the platform defines none for it.
+    """
+    shortcuts = QKeySequence.keyBindings(key)
+    action.setShortcuts(shortcuts or [QKeySequence(fallback)])
+
+
+def next_number(names, prefix):
+    """
+    Return one more than the highest N among names of the form prefix + N,
+    so numbered names generated from it do not collide with existing ones.
+    """
+    start = len(prefix)
+    numbers = [int(name[start:]) for name in names
+               if name.startswith(prefix) and name[start:].isdecimal()]
+    return max(numbers, default=0) + 1
+
+
+def create_list_view(model):
+    """Create a read-only list view showing the given model."""
+    view = QListView()
+    view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    view.setModel(model)
+    return view
+
+
+def append_row(view, text):
+    """Append a row to the string list model of a view."""
+    model = view.model()
+    row = model.rowCount()
+    model.insertRow(row)
+    model.setData(model.index(row), text)
+
+
+def remove_current_row(view):
+    """Remove the selected row of a view, if any."""
+    current_row = view.currentIndex().row()
+    if current_row >= 0:
+        view.model().removeRow(current_row)
+
+
+class ThumbnailService(QObject):
+    """
+    Provides image thumbnails from an on-disk cache, generating missing
+    ones on the global thread pool. Emits ready with the requested image
+    path and the thumbnail pixmap, or failed with the path and an error
+    message.
+    
+    There is one cache file per image and thumbnail size, replaced when
+    the image changes. Thumbnails of deleted images are not removed.
+    """
+    ready = Signal(str, QPixmap)
+    failed = Signal(str, str)
+    
+    def __init__(self, max_size, parent=None):
+        super().__init__(parent)
+        self._max_size = max_size
+        # Directory relative image paths are resolved against, normally
+        # that of the open project
+        self.base_dir = None
+        # Requested paths of the images whose thumbnails are being
+        # generated, keyed by their resolved paths
+        self._pending = {}
+        cache_root = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+        self._cache_dir = Path(cache_root) / "thumbs"
+        
+    def resolve(self, file_path):
+        """Return the absolute path of an image."""
+        path = Path(file_path)
+        if self.base_dir is not None:
+            path = Path(self.base_dir, path)
+        return str(path.resolve())
+        
+    def cache_path(self, image_path):
+        """Return the cache file for an image, given its absolute path."""
+        size = self._max_size
+        key = f"{image_path}:{size.width()}x{size.height()}"
+        return self._cache_dir / f"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.png"
+        
+    def request(self, file_path):
+        """
+        Emit ready or failed for an image, now if it is cached or missing,
+        otherwise once its thumbnail has been generated. Relative paths
+        are resolved against base_dir.
+        """
+        image_path = self.resolve(file_path)
+        try:
+            mtime_ns = os.stat(image_path).st_mtime_ns
+        except OSError as e:
+            self.failed.emit(file_path, str(e))
+            return
+        cache_path = self.cache_path(image_path)
+        try:
+            # A thumbnail is current if it has the image's modification time
+            cached = cache_path.stat().st_mtime_ns == mtime_ns
+        except OSError:
+            cached = False
+        if cached:
+            self.ready.emit(file_path, QPixmap(str(cache_path)))
+            return
+        if image_path in self._pending:
+            return
+        self._pending[image_path] = file_path
+        task = IoTask(write_thumbnail, image_path, self._max_size, cache_path, mtime_ns)
+        task.signals.finished.connect(self.on_thumbnail_written)
+        task.signals.failed.connect(self.on_thumbnail_failed)
+        QThreadPool.globalInstance().start(task)
+        
+    def on_thumbnail_written(self, image_path, image):
+        """Turn a generated thumbnail into a pixmap on the GUI thread."""
+        file_path = self._pending.pop(image_path)
+        self.ready.emit(file_path, QPixmap.fromImage(image))
+        
+    def on_thumbnail_failed(self, image_path, message):
+        """Report an image whose thumbnail could not be generated."""
+        file_path = self._pending.pop(image_path)
+        self.failed.emit(file_path, message)
+
+
+class ScaledImageLabel(QLabel):
+    """
+    Label that draws its image scaled to fit while keeping the aspect
+    ratio. Scaling happens while painting, so no scaled copy of the image
+    is created when the label is resized. The background and border are
+    painted directly rather than through a style sheet, and the label is
+    marked opaque so Qt does not clear it before each paint.
+    """
+    BACKGROUND_COLOR = QColor(0xF0, 0xF0, 0xF0)
+    BORDER_COLOR = QColor(Qt.gray)
+    
+    def __init__(self, text=""):
+        super().__init__(text)
+        self._pixmap = None
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        # Keep the text and image clear of the 1px border
+        self.setContentsMargins(1, 1, 1, 1)
+        
+    def set_image(self, pixmap):
+        """Show the given pixmap in place of the label text."""
+        self._pixmap = pixmap
+        self.setText("")
+        self.update()
+        
+    def clear_image(self, text):
+        """Remove the image and show the given text instead."""
+        self._pixmap = None
+        self.setText(text)
+        self.update()
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.BACKGROUND_COLOR)
+        painter.setPen(self.BORDER_COLOR)
+        painter.drawRect(self.rect().adjusted(0, 0, -1, -1))
+        painter.end()
+        
+        super().paintEvent(event)
+        if self._pixmap is None or self._pixmap.isNull():
+            return
+        
+        # Fit the image inside the contents rect, centered
+        target = self.contentsRect()
+        size = self._pixmap.size().scaled(target.size(), Qt.KeepAspectRatio)
+        target.setLeft(target.left() + (target.width() - size.width()) // 2)
+        target.setTop(target.top() + (target.height() - size.height()) // 2)
+        target.setSize(size)
+        
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.drawPixmap(target, self._pixmap, self._pixmap.rect())
+        painter.end()
 
 
 class LocationEditor(QWidget):
     """Widget for editing game locations."""
     
+    # Bounding box of the cached thumbnails shown for locations
+    THUMBNAIL_SIZE = QSize(640, 480)
+    
     def __init__(self):
         super().__init__()
+        self.thumbnails = ThumbnailService(self.THUMBNAIL_SIZE, self)
+        self.thumbnails.ready.connect(self.on_thumbnail_ready)
+        self.thumbnails.failed.connect(self.on_thumbnail_failed)
+        # Path of the image the image label shows or is waiting for
+        self.shown_image = None
+        self.next_exit_number = 1
         self.setup_ui()
         
     def setup_ui(self):
@@ -32,14 +397,16 @@ class LocationEditor(QWidget):
         left_panel = QVBoxLayout()
         left_panel.addWidget(QLabel("Locations:"))
         
-        self.location_list = QListWidget()
-        self.location_list.currentItemChanged.connect(self.on_location_selected)
+        self.location_model = LocationsModel(self)
+        self.location_list = create_list_view(self.location_model)
+        self.location_list.selectionModel().currentChanged.connect(self.on_location_selected)
+        self.location_model.modelReset.connect(self.on_locations_reset)
         left_panel.addWidget(self.location_list)
         
         # Add/Remove buttons
         button_layout = QHBoxLayout()
-        self.add_location_btn = QPushButton("Add Location")
-        self.remove_location_btn = QPushButton("Remove Location")
+        self.add_location_btn = QPushButton(icon("list-add"), "Add Location")
+        self.remove_location_btn = QPushButton(icon("list-remove"), "Remove Location")
         self.add_location_btn.clicked.connect(self.add_location)
         self.remove_location_btn.clicked.connect(self.remove_location)
         button_layout.addWidget(self.add_location_btn)
@@ -57,7 +424,7 @@ class LocationEditor(QWidget):
         form_layout = QFormLayout()
         self.location_id_edit = QLineEdit()
         self.location_title_edit = QLineEdit()
-        self.location_description_edit = QTextEdit()
+        self.location_description_edit = QPlainTextEdit()
         self.location_description_edit.setMaximumHeight(100)
         
         form_layout.addRow("Location ID:", self.location_id_edit)
@@ -68,13 +435,12 @@ class LocationEditor(QWidget):
         image_group = QGroupBox("Location Image")
         image_layout = QVBoxLayout()
         
-        self.image_label = QLabel("No image selected")
+        self.image_label = ScaledImageLabel("No image selected")
         self.image_label.setMinimumHeight(200)
-        self.image_label.setStyleSheet("border: 1px solid gray; background-color: #f0f0f0;")
         self.image_label.setAlignment(Qt.AlignCenter)
         
         image_button_layout = QHBoxLayout()
-        self.load_image_btn = QPushButton("Load Image")
+        self.load_image_btn = QPushButton(icon("document-open"), "Load Image")
         self.generate_image_btn = QPushButton("Generate with AI")
         self.load_image_btn.clicked.connect(self.load_image)
         self.generate_image_btn.clicked.connect(self.generate_image)
@@ -88,11 +454,11 @@ class LocationEditor(QWidget):
         # Exits section
         exits_group = QGroupBox("Exits")
         exits_layout = QVBoxLayout()
-        self.exits_list = QListWidget()
+        self.exits_list = create_list_view(QStringListModel(self))
         
         exits_button_layout = QHBoxLayout()
-        self.add_exit_btn = QPushButton("Add Exit")
-        self.remove_exit_btn = QPushButton("Remove Exit")
+        self.add_exit_btn = QPushButton(icon("list-add"), "Add Exit")
+        self.remove_exit_btn = QPushButton(icon("list-remove"), "Remove Exit")
         self.add_exit_btn.clicked.connect(self.add_exit)
         self.remove_exit_btn.clicked.connect(self.remove_exit)
         exits_button_layout.addWidget(self.add_exit_btn)
@@ -116,36 +482,69 @@ class LocationEditor(QWidget):
         
     def add_location(self):
         """Add a new location to the list."""
-        location_id = f"location_{self.location_list.count() + 1}"
-        item = QListWidgetItem(location_id)
-        self.location_list.addItem(item)
-        self.location_list.setCurrentItem(item)
+        location_id = self.location_model.new_location_id()
+        location = AdvGPTFormat.create_location(location_id, location_id, "")
+        row = self.location_model.add_location(location_id, location)
+        self.location_list.setCurrentIndex(self.location_model.index(row))
         
     def remove_location(self):
         """Remove the selected location."""
-        current_item = self.location_list.currentItem()
-        if current_item:
-            self.location_list.takeItem(self.location_list.row(current_item))
+        remove_current_row(self.location_list)
             
     def on_location_selected(self, current, previous):
         """Handle location selection change."""
-        if current:
+        if current.isValid():
             # Load location data into form
             # This would be connected to the actual data model
-            pass
+            location_id, location = self.location_model.location(current.row())
+            self.show_image(location.get("image"))
+        else:
+            self.show_image(None)
+            
+    def on_locations_reset(self):
+        """Clear the image when the location list is replaced."""
+        # Resetting the model clears the selection without a currentChanged
+        self.show_image(None)
+        
+    def show_image(self, file_path):
+        """Show an image in the image label once its thumbnail is ready."""
+        self.shown_image = file_path
+        if file_path:
+            # Clear the previous image until this one is ready
+            self.image_label.clear_image("Loading image...")
+            self.thumbnails.request(file_path)
+        else:
+            self.image_label.clear_image("No image selected")
+                
+    def current_location(self):
+        """Return the selected location's data, or None."""
+        current = self.location_list.currentIndex()
+        if not current.isValid():
+            return None
+        return self.location_model.location(current.row())[1]
+        
+    def on_thumbnail_ready(self, file_path, pixmap):
+        """Show a thumbnail if it is the one the image label waits for."""
+        if file_path == self.shown_image:
+            self.image_label.set_image(pixmap)
+            
+    def on_thumbnail_failed(self, file_path, message):
+        """Show that the awaited image could not be loaded."""
+        if file_path == self.shown_image:
+            self.image_label.clear_image("Image not available")
             
     def load_image(self):
         """Load an image file for the current location."""
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Load Location Image", "", 
-            "Image Files (*.png *.jpg *.jpeg *.bmp *.gif)"
+            IMAGE_FILE_FILTER
         )
         if file_path:
-            pixmap = QPixmap(file_path)
-            scaled_pixmap = pixmap.scaled(
-                self.image_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
-            self.image_label.setPixmap(scaled_pixmap)
+            self.show_image(file_path)
+            
+            location = self.current_location()
+            if location is not None:
+                location["image"] = file_path
             
     def generate_image(self):
         """Generate an AI image for the current location."""
@@ -154,14 +553,13 @@ class LocationEditor(QWidget):
     def add_exit(self):
         """Add a new exit to the current location."""
         # This would open a dialog to configure the exit
-        exit_name = f"Exit {self.exits_list.count() + 1}"
-        self.exits_list.addItem(exit_name)
+        exit_name = "Exit %d" % self.next_exit_number
+        self.next_exit_number += 1
+        append_row(self.exits_list, exit_name)
         
     def remove_exit(self):
         """Remove the selected exit."""
-        current_row = self.exits_list.currentRow()
-        if current_row >= 0:
-            self.exits_list.takeItem(current_row)
+        remove_current_row(self.exits_list)
 
 
 class StoryEditor(QWidget):
@@ -169,6 +567,11 @@ class StoryEditor(QWidget):
     
     def __init__(self):
         super().__init__()
+        self.next_item_number = 1
+        self.next_flag_number = 1
+        # Loaded item data and flag values, keyed by the names in the lists
+        self.item_data = {}
+        self.flag_values = {}
         self.setup_ui()
         
     def setup_ui(self):
@@ -180,7 +583,7 @@ class StoryEditor(QWidget):
         
         self.game_title_edit = QLineEdit()
         self.game_author_edit = QLineEdit()
-        self.game_description_edit = QTextEdit()
+        self.game_description_edit = QPlainTextEdit()
         self.game_description_edit.setMaximumHeight(80)
         
         metadata_layout.addRow("Game Title:", self.game_title_edit)
@@ -192,7 +595,7 @@ class StoryEditor(QWidget):
         story_group = QGroupBox("Story Content")
         story_layout = QVBoxLayout()
         
-        self.story_text_edit = QTextEdit()
+        self.story_text_edit = QPlainTextEdit()
         self.story_text_edit.setPlaceholderText("Enter your adventure story, dialogue, and narrative content here...")
         
         story_layout.addWidget(self.story_text_edit)
@@ -205,11 +608,11 @@ class StoryEditor(QWidget):
         # Inventory items
         inventory_layout = QVBoxLayout()
         inventory_layout.addWidget(QLabel("Inventory Items:"))
-        self.inventory_list = QListWidget()
+        self.inventory_list = create_list_view(QStringListModel(self))
         
         inventory_buttons = QHBoxLayout()
-        self.add_item_btn = QPushButton("Add Item")
-        self.remove_item_btn = QPushButton("Remove Item")
+        self.add_item_btn = QPushButton(icon("list-add"), "Add Item")
+        self.remove_item_btn = QPushButton(icon("list-remove"), "Remove Item")
         self.add_item_btn.clicked.connect(self.add_inventory_item)
         self.remove_item_btn.clicked.connect(self.remove_inventory_item)
         inventory_buttons.addWidget(self.add_item_btn)
@@ -221,11 +624,11 @@ class StoryEditor(QWidget):
         # Game flags
         flags_layout = QVBoxLayout()
         flags_layout.addWidget(QLabel("Game Flags:"))
-        self.flags_list = QListWidget()
+        self.flags_list = create_list_view(QStringListModel(self))
         
         flags_buttons = QHBoxLayout()
-        self.add_flag_btn = QPushButton("Add Flag")
-        self.remove_flag_btn = QPushButton("Remove Flag")
+        self.add_flag_btn = QPushButton(icon("list-add"), "Add Flag")
+        self.remove_flag_btn = QPushButton(icon("list-remove"), "Remove Flag")
         self.add_flag_btn.clicked.connect(self.add_flag)
         self.remove_flag_btn.clicked.connect(self.remove_flag)
         flags_buttons.addWidget(self.add_flag_btn)
@@ -244,25 +647,34 @@ class StoryEditor(QWidget):
         
     def add_inventory_item(self):
         """Add a new inventory item."""
-        item_name = f"Item {self.inventory_list.count() + 1}"
-        self.inventory_list.addItem(item_name)
+        item_name = "Item %d" % self.next_item_number
+        self.next_item_number += 1
+        append_row(self.inventory_list, item_name)
         
     def remove_inventory_item(self):
         """Remove the selected inventory item."""
-        current_row = self.inventory_list.currentRow()
-        if current_row >= 0:
-            self.inventory_list.takeItem(current_row)
+        remove_current_row(self.inventory_list)
             
     def add_flag(self):
         """Add a new game flag."""
-        flag_name = f"flag_{self.flags_list.count() + 1}"
-        self.flags_list.addItem(flag_name)
+        flag_name = "flag_%d" % self.next_flag_number
+        self.next_flag_number += 1
+        append_row(self.flags_list, flag_name)
         
     def remove_flag(self):
         """Remove the selected flag."""
-        current_row = self.flags_list.currentRow()
-        if current_row >= 0:
-            self.flags_list.takeItem(current_row)
+        remove_current_row(self.flags_list)
+        
+    def inventory_items(self):
+        """Return the listed inventory items as a dict keyed by item ID."""
+        return {
+            name: self.item_data[name] if name in self.item_data else AdvGPTFormat.create_item(name, name, "")
+            for name in self.inventory_list.model().stringList()
+        }
+        
+    def game_flags(self):
+        """Return the listed game flags with their initial values."""
+        return {name: self.flag_values.get(name, False) for name in self.flags_list.model().stringList()}
 
 
 class ExportTab(QWidget):
@@ -317,7 +729,8 @@ class ExportTab(QWidget):
         log_group = QGroupBox("Export Log")
         log_layout = QVBoxLayout()
         
-        self.export_log = QTextEdit()
+        self.log_buffer = []
+        self.export_log = QPlainTextEdit()
         self.export_log.setReadOnly(True)
         self.export_log.setMaximumHeight(150)
         
@@ -327,6 +740,18 @@ class ExportTab(QWidget):
         layout.addWidget(export_group)
         layout.addWidget(log_group)
         
+    def log(self, line):
+        """Queue a line for the export log; queued lines are shown together."""
+        if not self.log_buffer:
+            QTimer.singleShot(0, self.flush_log)
+        self.log_buffer.append(line)
+        
+    def flush_log(self):
+        """Append all queued lines to the export log in one update."""
+        if self.log_buffer:
+            self.export_log.appendPlainText("\n".join(self.log_buffer))
+            self.log_buffer.clear()
+            
     def browse_export_path(self):
         """Browse for export directory."""
         directory = QFileDialog.getExistingDirectory(self, "Select Export Directory")
@@ -335,32 +760,59 @@ class ExportTab(QWidget):
             
     def export_project(self):
         """Export the current project as .advgpt format."""
-        self.export_log.append("Exporting .advgpt project...")
+        self.log("Exporting .advgpt project...")
         # Implementation would save the project in the defined JSON format
-        self.export_log.append("Export completed successfully!")
+        self.log("Export completed successfully!")
         
     def export_windows(self):
         """Export Windows executable."""
-        self.export_log.append("Exporting Windows executable...")
-        self.export_log.append("This feature will be implemented when the C engine is ready.")
+        self.log("Exporting Windows executable...")
+        self.log("This feature will be implemented when the C engine is ready.")
         
     def export_macos(self):
         """Export macOS app."""
-        self.export_log.append("Exporting macOS app...")
-        self.export_log.append("This feature will be implemented when the C engine is ready.")
+        self.log("Exporting macOS app...")
+        self.log("This feature will be implemented when the C engine is ready.")
         
     def export_linux(self):
         """Export Linux binary."""
-        self.export_log.append("Exporting Linux binary...")
-        self.export_log.append("This feature will be implemented when the C engine is ready.")
+        self.log("Exporting Linux binary...")
+        self.log("This feature will be implemented when the C engine is ready.")
+
+
+class LazyTab(QWidget):
+    """
+    Tab page that creates its content widget on first use, so editors the
+    user never opens are never built.
+    """
+    
+    def __init__(self, factory):
+        super().__init__()
+        self._factory = factory
+        self._content = None
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        
+    def content(self):
+        """Return the content widget, creating it if needed."""
+        if self._content is None:
+            self._content = self._factory()
+            self.layout().addWidget(self._content)
+            # Children added to an already visible widget start hidden
+            self._content.show()
+        return self._content
 
 
 class AdventureGPTEditor(QMainWindow):
     """Main application window for AdventureGPT Editor."""
     
+    # How long status bar notifications stay visible
+    STATUS_MESSAGE_TIMEOUT_MS = 3000
+    
     def __init__(self):
         super().__init__()
         self.current_project_path = None
+        self.settings = QSettings("AdventureGPT", "Editor")
         self.setup_ui()
         self.setup_menu()
         
@@ -378,17 +830,41 @@ class AdventureGPTEditor(QMainWindow):
         # Create tab widget
         self.tab_widget = QTabWidget()
         
-        # Add tabs
-        self.location_editor = LocationEditor()
-        self.story_editor = StoryEditor()
-        self.export_tab = ExportTab()
+        # Add tabs; each editor is built when its tab is first shown
+        self.location_page = LazyTab(LocationEditor)
+        self.story_page = LazyTab(StoryEditor)
+        self.export_page = LazyTab(ExportTab)
+        
+        self.tab_widget.addTab(self.location_page, "Map Editor")
+        self.tab_widget.addTab(self.story_page, "Story Editor")
+        self.tab_widget.addTab(self.export_page, "Export")
         
-        self.tab_widget.addTab(self.location_editor, "Map Editor")
-        self.tab_widget.addTab(self.story_editor, "Story Editor")
-        self.tab_widget.addTab(self.export_tab, "Export")
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
+        self.on_tab_changed(self.tab_widget.currentIndex())
         
         layout.addWidget(self.tab_widget)
         
+        # Status bar for non-blocking notifications
+        self.setStatusBar(QStatusBar())
+        
+    @property
+    def location_editor(self):
+        return self.location_page.content()
+        
+    @property
+    def story_editor(self):
+        return self.story_page.content()
+        
+    @property
+    def export_tab(self):
+        return self.export_page.content()
+        
+    def on_tab_changed(self, index):
+        """Build the editor of a tab the first time it is shown."""
+        tab = self.tab_widget.widget(index)
+        if tab is not None:
+            tab.content()
+        
     def setup_menu(self):
         """Set up the application menu bar."""
         menubar = self.menuBar()
@@ -396,43 +872,43 @@ class AdventureGPTEditor(QMainWindow):
         # File menu
         file_menu = menubar.addMenu("File")
         
-        new_action = QAction("New Project", self)
-        new_action.setShortcut("Ctrl+N")
-        new_action.triggered.connect(self.new_project)
-        file_menu.addAction(new_action)
+        self.new_action = QAction("New Project", self)
+        set_standard_shortcut(self.new_action, QKeySequence.StandardKey.New, "Ctrl+N")
+        self.new_action.triggered.connect(self.new_project)
+        file_menu.addAction(self.new_action)
         
-        open_action = QAction("Open Project", self)
-        open_action.setShortcut("Ctrl+O")
-        open_action.triggered.connect(self.open_project)
-        file_menu.addAction(open_action)
+        self.open_action = QAction("Open Project", self)
+        set_standard_shortcut(self.open_action, QKeySequence.StandardKey.Open, "Ctrl+O")
+        self.open_action.triggered.connect(self.open_project)
+        file_menu.addAction(self.open_action)
         
-        save_action = QAction("Save Project", self)
-        save_action.setShortcut("Ctrl+S")
-        save_action.triggered.connect(self.save_project)
-        file_menu.addAction(save_action)
+        self.save_action = QAction("Save Project", self)
+        set_standard_shortcut(self.save_action, QKeySequence.StandardKey.Save, "Ctrl+S")
+        self.save_action.triggered.connect(self.save_project)
+        file_menu.addAction(self.save_action)
         
-        save_as_action = QAction("Save Project As...", self)
-        save_as_action.setShortcut("Ctrl+Shift+S")
-        save_as_action.triggered.connect(self.save_project_as)
-        file_menu.addAction(save_as_action)
+        self.save_as_action = QAction("Save Project As...", self)
+        set_standard_shortcut(self.save_as_action, QKeySequence.StandardKey.SaveAs, "Ctrl+Shift+S")
+        self.save_as_action.triggered.connect(self.save_project_as)
+        file_menu.addAction(self.save_as_action)
         
         file_menu.addSeparator()
         
-        exit_action = QAction("Exit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
+        self.exit_action = QAction("Exit", self)
+        set_standard_shortcut(self.exit_action, QKeySequence.StandardKey.Quit, "Ctrl+Q")
+        self.exit_action.triggered.connect(self.close)
+        file_menu.addAction(self.exit_action)
         
         # Help menu
         help_menu = menubar.addMenu("Help")
         
-        about_action = QAction("About", self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+        self.about_action = QAction("About", self)
+        self.about_action.triggered.connect(self.show_about)
+        help_menu.addAction(self.about_action)
         
     def new_project(self):
         """Create a new project."""
-        self.current_project_path = None
+        self.set_project_path(None)
         self.setWindowTitle("AdventureGPT Editor - New Project")
         # Clear all editors
         # This would reset all the form fields and lists
@@ -440,19 +916,47 @@ class AdventureGPTEditor(QMainWindow):
     def open_project(self):
         """Open an existing project."""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Open AdventureGPT Project", "", 
-            "AdventureGPT Projects (*.advgpt);;JSON Files (*.json)"
+            self, "Open AdventureGPT Project", self.last_project_dir(), 
+            PROJECT_FILE_FILTER
         )
         if file_path:
-            try:
-                with open(file_path, 'r') as f:
-                    project_data = json.load(f)
-                self.load_project_data(project_data)
-                self.current_project_path = file_path
-                self.setWindowTitle(f"AdventureGPT Editor - {Path(file_path).name}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to open project: {str(e)}")
+            self.set_last_project_dir(file_path)
+            # Read and parse on a worker thread so the window keeps painting
+            task = IoTask(read_project_file, file_path)
+            task.signals.finished.connect(self.on_project_opened)
+            task.signals.failed.connect(self.on_project_open_failed)
+            QThreadPool.globalInstance().start(task)
+            
+    def on_project_opened(self, file_path, project_data):
+        """Show a project that finished loading."""
+        try:
+            self.load_project_data(project_data)
+            self.set_project_path(file_path)
+            self.setWindowTitle(f"AdventureGPT Editor - {Path(file_path).name}")
+        except Exception as e:
+            self.on_project_open_failed(file_path, str(e))
+            
+    def on_project_open_failed(self, file_path, message):
+        """Report a project that could not be opened."""
+        QMessageBox.critical(self, "Error", f"Failed to open project: {message}")
                 
+    def set_project_path(self, file_path):
+        """
+        Set the path of the open project. Relative image paths in the
+        project are resolved against its directory.
+        """
+        self.current_project_path = file_path
+        base_dir = Path(file_path).parent if file_path else None
+        self.location_editor.thumbnails.base_dir = base_dir
+        
+    def last_project_dir(self):
+        """Return the directory a project was last opened from or saved to."""
+        return self.settings.value("last_dir", "")
+        
+    def set_last_project_dir(self, file_path):
+        """Remember the directory of a project file for the file dialogs."""
+        self.settings.setValue("last_dir", str(Path(file_path).parent))
+        
     def save_project(self):
         """Save the current project."""
         if self.current_project_path:
@@ -463,47 +967,95 @@ class AdventureGPTEditor(QMainWindow):
     def save_project_as(self):
         """Save the project with a new name."""
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "Save AdventureGPT Project", "", 
-            "AdventureGPT Projects (*.advgpt);;JSON Files (*.json)"
+            self, "Save AdventureGPT Project", self.last_project_dir(), 
+            PROJECT_FILE_FILTER
         )
         if file_path:
+            self.set_last_project_dir(file_path)
             self.save_project_to_path(file_path)
-            self.current_project_path = file_path
+            self.set_project_path(file_path)
             self.setWindowTitle(f"AdventureGPT Editor - {Path(file_path).name}")
             
     def save_project_to_path(self, file_path):
         """Save project data to specified path."""
         try:
-            project_data = self.get_project_data()
-            with open(file_path, 'w') as f:
-                json.dump(project_data, f, indent=2)
-            QMessageBox.information(self, "Success", "Project saved successfully!")
+            # Serialize here, since the project data shares its dicts with the
+            # editors, which stay editable while the file is written
+            data = dumps(self.get_project_data())
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save project: {str(e)}")
+            self.on_project_save_failed(file_path, str(e))
+            return
+        
+        # Write on a worker thread so the window keeps painting. Saving stays
+        # disabled until this save is done, so two saves never write at the
+        # same time.
+        self.set_save_enabled(False)
+        task = IoTask(write_project_file, file_path, data)
+        task.signals.finished.connect(self.on_project_saved)
+        task.signals.failed.connect(self.on_project_save_failed)
+        QThreadPool.globalInstance().start(task)
+        
+    def set_save_enabled(self, enabled):
+        """Enable or disable the save actions."""
+        self.save_action.setEnabled(enabled)
+        self.save_as_action.setEnabled(enabled)
+        
+    def on_project_saved(self, file_path, result):
+        """Report a project that finished saving."""
+        self.set_save_enabled(True)
+        self.statusBar().showMessage(f"Saved {Path(file_path).name}", self.STATUS_MESSAGE_TIMEOUT_MS)
+        
+    def on_project_save_failed(self, file_path, message):
+        """Report a project that could not be saved."""
+        self.set_save_enabled(True)
+        QMessageBox.critical(self, "Error", f"Failed to save project: {message}")
             
     def get_project_data(self):
         """Get current project data as dictionary."""
         # This would collect data from all the editors
+        story_editor = self.story_editor
         return {
             "meta": {
-                "title": self.story_editor.game_title_edit.text() or "Untitled Adventure",
-                "author": self.story_editor.game_author_edit.text() or "Unknown",
-                "description": self.story_editor.game_description_edit.toPlainText()
+                "title": story_editor.game_title_edit.text() or "Untitled Adventure",
+                "author": story_editor.game_author_edit.text() or "Unknown",
+                "description": story_editor.game_description_edit.toPlainText()
             },
             "start_location": "start",
-            "locations": {},
-            "inventory_items": [],
-            "flags": {}
+            "locations": self.location_editor.location_model.locations(),
+            "inventory_items": story_editor.inventory_items(),
+            "game_flags": story_editor.game_flags()
         }
         
     def load_project_data(self, data):
         """Load project data into the editors."""
-        # This would populate all the form fields with the loaded data
-        if "meta" in data:
-            meta = data["meta"]
-            self.story_editor.game_title_edit.setText(meta.get("title", ""))
-            self.story_editor.game_author_edit.setText(meta.get("author", ""))
-            self.story_editor.game_description_edit.setPlainText(meta.get("description", ""))
+        # This would populate all the form fields with the loaded data.
+        # Everything that can fail is read before any editor is changed, so
+        # a bad project leaves the editors as they were.
+        meta = ProjectMeta.from_dict(data["meta"]) if "meta" in data else None
+        locations = list(data.get("locations", {}).items())
+        item_data = dict(data.get("inventory_items", {}))
+        flag_values = dict(data.get("game_flags", {}))
+        next_item_number = next_number(item_data, "Item ")
+        next_flag_number = next_number(flag_values, "flag_")
+        
+        story_editor = self.story_editor
+        if meta is not None:
+            # Fill the form without emitting a change signal per field
+            with QSignalBlocker(story_editor.game_title_edit), \
+                    QSignalBlocker(story_editor.game_author_edit), \
+                    QSignalBlocker(story_editor.game_description_edit):
+                story_editor.game_title_edit.setText(meta.title)
+                story_editor.game_author_edit.setText(meta.author)
+                story_editor.game_description_edit.setPlainText(meta.description)
+        
+        # Replace each list in one model reset rather than row by row
+        self.location_editor.location_model.bulk_load(locations)
+        story_editor.item_data = item_data
+        story_editor.flag_values = flag_values
+        story_editor.inventory_list.model().setStringList(list(item_data))
+        story_editor.flags_list.model().setStringList(list(flag_values))
+        story_editor.next_item_number = next_item_number
+        story_editor.next_flag_number = next_flag_number
             
     def show_about(self):
         """Show about dialog."""
@@ -0,0 +1,165 @@
+"""
+Tests for the .advgpt format module.
+
+Run from the repository root with:
+
+    python -m unittest discover tests
+"""
+
+import copy
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+EDITOR_DIR = Path(__file__).resolve().parent.parent / "editor"
+sys.path.insert(0, str(EDITOR_DIR))
+
+import fastjsonschema
+from fastjsonschema import JsonSchemaValueException
+
+import generate_validator
+from advgpt_format import AdvGPTFormat, SCHEMA, _VALIDATE, _is_valid_game
+
+
+def sample_game():
+    """Return a small valid game with two connected locations."""
+    game = AdvGPTFormat.create_empty_game()
+    game["locations"]["hall"] = AdvGPTFormat.create_location(
+        "hall", "Hall", "A long hall.", exits={"south": "start"}
+    )
+    game["locations"]["start"]["exits"]["north"] = "hall"
+    return game
+
+
+def set_path(game, path, value):
+    """Set the value at a tuple of keys."""
+    for key in path[:-1]:
+        game = game[key]
+    game[path[-1]] = value
+
+
+def delete_path(game, path):
+    """Delete the value at a tuple of keys."""
+    for key in path[:-1]:
+        game = game[key]
+    del game[path[-1]]
+
+
+# Games that break SCHEMA, as (description, change) pairs
+SCHEMA_ERRORS = [
+    ("game is not an object", lambda g: ["not", "a", "game"]),
+    ("missing meta", lambda g: delete_path(g, ("meta",))),
+    ("missing player", lambda g: delete_path(g, ("player",))),
+    ("meta is not an object", lambda g: set_path(g, ("meta",), "meta")),
+    ("missing meta title", lambda g: delete_path(g, ("meta", "title"))),
+    ("start location is not a string", lambda g: set_path(g, ("start_location",), 1)),
+    ("locations is not an object", lambda g: set_path(g, ("locations",), [])),
+    ("location is not an object", lambda g: set_path(g, ("locations", "hall"), "hall")),
+    ("location without exits", lambda g: delete_path(g, ("locations", "hall", "exits"))),
+    ("exits is not an object", lambda g: set_path(g, ("locations", "hall", "exits"), [])),
+    ("exit target is not a string", lambda g: set_path(g, ("locations", "hall", "exits", "up"), 5)),
+    ("location ID is not a string", lambda g: set_path(g, ("locations", 5), copy.deepcopy(g["locations"]["hall"]))),
+    ("player is not an object", lambda g: set_path(g, ("player",), None)),
+    ("missing player flags", lambda g: delete_path(g, ("player", "flags"))),
+]
+
+# Games that match SCHEMA but have broken location references
+REFERENCE_ERRORS = [
+    ("unknown start location", lambda g: set_path(g, ("start_location",), "nowhere")),
+    ("unknown exit target", lambda g: set_path(g, ("locations", "hall", "exits", "up"), "nowhere")),
+    ("unknown player location", lambda g: set_path(g, ("player", "current_location"), "nowhere")),
+]
+
+
+def broken_game(change):
+    """Return sample_game() with the given change applied."""
+    game = sample_game()
+    replaced = change(game)
+    return game if replaced is None else replaced
+
+
+class ValidatorTest(unittest.TestCase):
+    
+    def test_generated_validator_is_up_to_date(self):
+        expected = generate_validator.HEADER + fastjsonschema.compile_to_code(SCHEMA)
+        actual = (EDITOR_DIR / "_advgpt_validator.py").read_text(encoding="utf-8")
+        self.assertEqual(actual, expected, "run editor/generate_validator.py")
+        
+    def test_valid_game(self):
+        game = sample_game()
+        self.assertTrue(_is_valid_game(game))
+        _VALIDATE(game)
+        self.assertEqual(AdvGPTFormat.validate_game_data(game), [])
+        
+    def test_schema_errors(self):
+        for description, change in SCHEMA_ERRORS:
+            with self.subTest(description):
+                game = broken_game(change)
+                self.assertFalse(_is_valid_game(game))
+                with self.assertRaises(JsonSchemaValueException):
+                    _VALIDATE(game)
+                self.assertEqual(len(AdvGPTFormat.validate_game_data(game)), 1)
+                
+    def test_reference_errors(self):
+        for description, change in REFERENCE_ERRORS:
+            with self.subTest(description):
+                game = broken_game(change)
+                self.assertFalse(_is_valid_game(game))
+                _VALIDATE(game)
+                self.assertTrue(AdvGPTFormat.validate_game_data(game))
+                self.assertEqual(len(AdvGPTFormat.validate_game_data(game, fast=True)), 1)
+
+
+class SaveLoadTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file_path = str(Path(self.tmp_dir.name) / "game.advgpt")
+        
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        
+    def test_round_trip(self):
+        game = sample_game()
+        self.assertTrue(AdvGPTFormat.save_to_file(game, self.file_path))
+        self.assertEqual(AdvGPTFormat.load_from_file(self.file_path), game)
+        
+    def test_saved_file_matches_json_dump(self):
+        game = sample_game()
+        game["meta"]["title"] = "Café"
+        self.assertTrue(AdvGPTFormat.save_to_file(game, self.file_path))
+        expected = json.dumps(game, indent=2, ensure_ascii=False)
+        self.assertEqual(Path(self.file_path).read_text(encoding="utf-8"), expected)
+        
+    def test_non_string_keys_are_saved_as_strings(self):
+        game = sample_game()
+        game[7] = "extra"
+        self.assertTrue(AdvGPTFormat.save_to_file(game, self.file_path))
+        saved = json.loads(Path(self.file_path).read_bytes())
+        self.assertEqual(saved["7"], "extra")
+        
+    def test_invalid_game_is_not_saved(self):
+        game = sample_game()
+        game["locations"]["hall"]["exits"]["up"] = "nowhere"
+        with self.assertLogs("advgpt_format", "WARNING"):
+            self.assertFalse(AdvGPTFormat.save_to_file(game, self.file_path))
+        self.assertFalse(Path(self.file_path).exists())
+        
+    def test_reload_after_same_mtime_rewrite(self):
+        game = sample_game()
+        game["meta"]["title"] = "AAA"
+        AdvGPTFormat.save_to_file(game, self.file_path)
+        mtime_ns = Path(self.file_path).stat().st_mtime_ns
+        self.assertEqual(AdvGPTFormat.load_from_file(self.file_path)["meta"]["title"], "AAA")
+        
+        game["meta"]["title"] = "BBB"
+        AdvGPTFormat.save_to_file(game, self.file_path)
+        os.utime(self.file_path, ns=(mtime_ns, mtime_ns))
+        self.assertEqual(AdvGPTFormat.load_from_file(self.file_path)["meta"]["title"], "BBB")
+
+
+if __name__ == "__main__":
+    unittest.main()